@@ -1,16 +1,18 @@
 import os
 import bcrypt
-import logging
 from jose import jwt
 from datetime import datetime, timedelta
 from fastapi import APIRouter, HTTPException, Depends, Request, Response, status, Body
 from pydantic import BaseModel, EmailStr, Field
 from database import users_collection
 from dotenv import load_dotenv
+from logger import get_logger
 
 # Load environment variables
 load_dotenv()
 
+logger = get_logger(__name__)
+
 # Router for authentication
 auth_router = APIRouter()
 
@@ -53,6 +55,7 @@ async def signup(request: SignupRequest):
         raise HTTPException(status_code=400, detail="All fields are required")
 
     if users_collection.find_one({"username": request.username}):
+        logger.warning("Signup rejected, user already exists", extra={"username": request.username})
         raise HTTPException("User already exists")
 
     hashed_password = hash_password(request.password)
@@ -72,6 +75,7 @@ async def signup(request: SignupRequest):
         "preferences": default_preferences
     })
 
+    logger.info("User registered", extra={"username": request.username})
     return {"message": "User registered successfully with default preferences"}
 
 # Login Endpoint
@@ -80,6 +84,7 @@ async def login(request: LoginRequest):
     user = users_collection.find_one({"username": request.username})
     
     if not user or not verify_password(request.password, user["password"]):
+        logger.warning("Login failed", extra={"username": request.username})
         raise HTTPException("No user exists with this mail")
 
     # Check and add default preferences if not present
@@ -98,6 +103,7 @@ async def login(request: LoginRequest):
         user["preferences"] = default_preferences
 
     token = create_jwt_token(request.username)
+    logger.info("User logged in", extra={"username": request.username})
     return {"token": token, "username": request.username, "preferences": user["preferences"], "name": user["name"]}
 
 # Get User Profile
@@ -128,6 +134,7 @@ async def get_user_profile(username: str):
     except Exception as e:
         if isinstance(e, HTTPException):
             raise e
+        logger.exception("Failed to retrieve user profile")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to retrieve user profile: {str(e)}"
@@ -185,6 +192,7 @@ async def update_user_profile(profile_data: ProfileUpdateRequest):
     except Exception as e:
         if isinstance(e, HTTPException):
             raise e
+        logger.exception("Failed to update user profile")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to update user profile: {str(e)}"
@@ -11,6 +11,10 @@ from fastapi import Body
 from utils import extract_json
 import os
 from learning_path import process_learning_path_query
+from logger import get_logger
+from progress import get_daily_hours, build_progress_stats, plan_progress_stats, merge_progress_stats, parse_hours, summarize_progress
+
+logger = get_logger(__name__)
 
 # Router for chat
 chat_router = APIRouter()
@@ -26,7 +30,7 @@ def generate_response(prompt):
         )
         return response.choices[0].message.content
     except Exception as e:
-        print(f"Error generating response: {e}")
+        logger.error("Error generating response: %s", e)
         return "Error generating response. Please try again."
 
 async def generate_chat_stream(messages):
@@ -41,7 +45,7 @@ async def generate_chat_stream(messages):
         for chunk in response_stream:
             yield chunk.choices[0].delta.content
     except Exception as e:
-        print(f"Error in chat stream: {e}")
+        logger.error("Error in chat stream: %s", e)
         yield "Error in chat stream. Please try again."
 
 def store_chat_history(username, messages):
@@ -53,7 +57,7 @@ def store_chat_history(username, messages):
             upsert=True
         )
     except Exception as e:
-        print(f"Error storing chat history: {e}")
+        logger.error("Error storing chat history: %s", e)
 
 def filter_messages(messages):
     """Filters messages to keep only role and content."""
@@ -64,7 +68,13 @@ def filter_messages(messages):
 async def chat(user_prompt: str, username: str, isQuiz: bool = False, isLearningPath: bool = False):
     """Handles chat requests (both normal and streaming responses)"""
     try:
-        print(f"👤 User: {user_prompt} | 🆔 Username: {username}")
+        logger.info("Chat request received", extra={
+            "username": username,
+            "prompt_chars": len(user_prompt),
+            "is_quiz": isQuiz,
+            "is_learning_path": isLearningPath
+        })
+        logger.debug("User prompt", extra={"prompt": user_prompt})
 
         user_timestamp = datetime.datetime.utcnow().isoformat() + "Z"
 
@@ -126,7 +136,7 @@ async def chat(user_prompt: str, username: str, isQuiz: bool = False, isLearning
         return StreamingResponse(chat_stream(), media_type="text/plain")
 
     except Exception as e:
-        print(f"❌ Error: {str(e)}")
+        logger.exception("Error handling chat request")
         response_timestamp = datetime.datetime.utcnow().isoformat() + "Z"
         response_message = {
             "role": "assistant",
@@ -179,13 +189,13 @@ async def get_preferences(username: str):
         
         return {"preferences": preferences}
     except Exception as e:
-        print(f"❌ Error fetching preferences: {str(e)}")
+        logger.exception("Error fetching preferences")
         raise HTTPException(status_code=500, detail=f"Failed to fetch preferences: {str(e)}")
 
 
 @chat_router.get("/history")
 async def get_chat_history(username: str):
-    print(f"Fetching Chat History for: {username}")
+    logger.info("Fetching chat history", extra={"username": username})
 
     chat_session = chats_collection.find_one({"username": username})
     
@@ -215,14 +225,20 @@ async def save_path(
         duration = path.get("course_duration", "Unknown")
 
         existing_goal = next((goal for goal in learning_goals if goal["name"] == learning_goal_name), None)
+        daily_hours = get_daily_hours(chat_session.get("preferences"))
 
         if existing_goal:
             existing_goal["study_plans"].append(path)
+            if "progress_stats" in existing_goal:
+                merge_progress_stats(existing_goal["progress_stats"], plan_progress_stats(path, existing_goal["progress_stats"].get("daily_hours", daily_hours)))
+            else:
+                existing_goal["progress_stats"] = build_progress_stats(existing_goal["study_plans"], daily_hours)
         else:
             new_goal = {
                 "name": learning_goal_name,
                 "duration": duration,
-                "study_plans": [path]
+                "study_plans": [path],
+                "progress_stats": build_progress_stats([path], daily_hours)
             }
             learning_goals.append(new_goal)
 
@@ -234,7 +250,7 @@ async def save_path(
 
         return {"message": f"Learning path saved successfully under '{learning_goal_name}'"}
     except Exception as e:
-        print(f"❌ Error: {str(e)}")
+        logger.exception("Error saving learning path")
         raise HTTPException(status_code=500, detail=str(e))
 
 
@@ -248,9 +264,126 @@ async def get_all_goals(username: str):
         
         return {"learning_goals": chat_session["learning_goals"]}
     except Exception as e:
-        print(f"❌ Error: {str(e)}")
+        logger.exception("Error fetching learning goals")
         raise HTTPException(status_code=500, detail=str(e))
     
+def seed_progress_stats(username, goal_index, goal, daily_hours):
+    """Stores progress counters for a goal saved before progress tracking existed.
+
+    Only writes if no counters are stored yet, so a concurrent request that already
+    seeded (and incremented) them is never overwritten; in that case the stored
+    counters are returned instead.
+    """
+    goal_path = f"learning_goals.{goal_index}"
+    stats = build_progress_stats(goal.get("study_plans", []), daily_hours)
+    result = chats_collection.update_one(
+        {"username": username, f"{goal_path}.name": goal["name"], f"{goal_path}.progress_stats": {"$exists": False}},
+        {"$set": {f"{goal_path}.progress_stats": stats}}
+    )
+    if result.matched_count:
+        return stats
+
+    chat_session = chats_collection.find_one({"username": username}, {"learning_goals.progress_stats": 1}) or {}
+    stored_goals = chat_session.get("learning_goals", [])
+    if goal_index < len(stored_goals) and "progress_stats" in stored_goals[goal_index]:
+        return stored_goals[goal_index]["progress_stats"]
+    return stats
+
+
+@chat_router.post("/complete-topic")
+async def complete_topic(
+    username: str = Body(...),
+    learning_goal_name: str = Body(...),
+    topic_index: int = Body(...),
+    plan_index: int = Body(0),
+    subtopic_index: int = Body(None)
+):
+    """Marks a topic (or one of its subtopics) as completed and updates the goal's progress counters."""
+    try:
+        # Skip the chat history so the cost of an event doesn't grow with it
+        chat_session = chats_collection.find_one({"username": username}, {"learning_goals": 1, "preferences": 1}) or {}
+        learning_goals = chat_session.get("learning_goals", [])
+
+        goal_index = next((i for i, goal in enumerate(learning_goals) if goal["name"] == learning_goal_name), None)
+        if goal_index is None:
+            raise HTTPException(status_code=404, detail="Learning goal not found")
+        goal = learning_goals[goal_index]
+
+        if min(plan_index, topic_index, subtopic_index or 0) < 0:
+            raise HTTPException(status_code=400, detail="Indexes must be non-negative")
+
+        try:
+            topic = goal["study_plans"][plan_index]["topics"][topic_index]
+            if not isinstance(topic, dict):
+                raise TypeError(topic)
+            if subtopic_index is not None and not isinstance(topic["subtopics"][subtopic_index], dict):
+                raise TypeError(subtopic_index)
+        except (IndexError, KeyError, TypeError, AttributeError):
+            raise HTTPException(status_code=404, detail="Topic not found")
+
+        goal_path = f"learning_goals.{goal_index}"
+        item_path = f"{goal_path}.study_plans.{plan_index}.topics.{topic_index}"
+
+        # Goals saved before progress tracking get their counters computed once
+        stats = goal.get("progress_stats")
+        if stats is None:
+            stats = seed_progress_stats(username, goal_index, goal, get_daily_hours(chat_session.get("preferences")))
+
+        if subtopic_index is not None:
+            item_path = f"{item_path}.subtopics.{subtopic_index}"
+            increments = {"completed_subtopics": 1}
+        else:
+            increments = {
+                "completed_topics": 1,
+                "remaining_hours": -parse_hours(topic.get("time_required"), stats.get("daily_hours"))
+            }
+
+        # Only count the event if the item was not already completed
+        result = chats_collection.update_one(
+            {"username": username, f"{goal_path}.name": learning_goal_name, f"{item_path}.completed": {"$ne": True}},
+            {
+                "$set": {f"{item_path}.completed": True},
+                "$inc": {f"{goal_path}.progress_stats.{key}": value for key, value in increments.items()}
+            }
+        )
+        if result.modified_count:
+            merge_progress_stats(stats, increments)
+
+        return {"progress": summarize_progress(learning_goal_name, stats)}
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.exception("Error completing topic")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@chat_router.get("/progress")
+async def get_progress(username: str):
+    """Retrieves per-goal completion aggregates without the study plan bodies."""
+    try:
+        chat_session = chats_collection.find_one(
+            {"username": username},
+            {"learning_goals.name": 1, "learning_goals.progress_stats": 1}
+        )
+        if not chat_session or "learning_goals" not in chat_session:
+            return {"progress": []}
+
+        learning_goals = chat_session["learning_goals"]
+        if any("progress_stats" not in goal for goal in learning_goals):
+            # Goals saved before progress tracking need their plans once to seed the counters
+            chat_session = chats_collection.find_one({"username": username}, {"learning_goals": 1, "preferences": 1})
+            learning_goals = chat_session["learning_goals"]
+            daily_hours = get_daily_hours(chat_session.get("preferences"))
+            for goal_index, goal in enumerate(learning_goals):
+                if "progress_stats" not in goal:
+                    goal["progress_stats"] = seed_progress_stats(username, goal_index, goal, daily_hours)
+
+        return {"progress": [summarize_progress(goal["name"], goal["progress_stats"]) for goal in learning_goals]}
+    except Exception as e:
+        logger.exception("Error fetching progress")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 @chat_router.delete("/clear")
 async def clear_chat(username: str):
     """Clears the chat history for a specific user."""
@@ -265,7 +398,7 @@ async def clear_chat(username: str):
 
         return {"message": "Chat history cleared successfully."}
     except Exception as e:
-        print(f"❌ Error: {str(e)}")
+        logger.exception("Error clearing chat history")
         raise HTTPException(status_code=500, detail=str(e))
     
 
@@ -286,5 +419,5 @@ async def save_preferences(username: str = Body(...), preferences: dict = Body(.
 
         return {"message": "Preferences saved successfully."}
     except Exception as e:
-        print(f"❌ Error: {str(e)}")
+        logger.exception("Error saving preferences")
         raise HTTPException(status_code=500, detail=str(e))
\ No newline at end of file
@@ -1,13 +1,17 @@
 import os
+from urllib.parse import urlsplit
 from pymongo import MongoClient
 from dotenv import load_dotenv
+from logger import get_logger
+
+logger = get_logger(__name__)
 
 # Load environment variables
 load_dotenv()
 
 # MongoDB Connection
 mongo_uri = os.getenv("MONGO_URI")
-print("INFO : MONGO URI", mongo_uri)
+logger.info("Connecting to MongoDB", extra={"mongo_host": urlsplit(mongo_uri).hostname if mongo_uri else None})
 client = MongoClient(mongo_uri)
 
 db = client["chat_db"]  # Database name
@@ -185,6 +185,64 @@ export const getAllLearningGoals = async () => {
   }
 };
 
+// Mark a topic of a learning goal as completed
+export const markTopicCompletedAPI = async (learningGoalName, planIndex, topicIndex) => {
+  const username = localStorage.getItem("username");
+  const token = localStorage.getItem("token");
+
+  if (!username || !token) throw new Error("User not authenticated");
+
+  try {
+    const response = await fetch(`${API_BASE_URL}/chat/complete-topic`, {
+      method: "POST",
+      headers: {
+        Authorization: `Bearer ${token}`,
+        "Content-Type": "application/json",
+      },
+      body: JSON.stringify({
+        username,
+        learning_goal_name: learningGoalName,
+        plan_index: planIndex,
+        topic_index: topicIndex,
+      }),
+    });
+
+    if (!response.ok) throw new Error("Failed to mark topic as completed");
+    const data = await response.json();
+    return data.progress;
+  } catch (error) {
+    console.error("Error marking topic as completed:", error);
+    throw error;
+  }
+};
+
+// Get per-goal progress aggregates
+export const getLearningProgress = async () => {
+  const username = localStorage.getItem("username");
+  const token = localStorage.getItem("token");
+
+  if (!username || !token) throw new Error("User not authenticated");
+
+  try {
+    const response = await fetch(
+      `${API_BASE_URL}/chat/progress?username=${encodeURIComponent(username)}`,
+      {
+        method: "GET",
+        headers: {
+          Authorization: `Bearer ${token}`,
+        },
+      }
+    );
+
+    if (!response.ok) throw new Error("Failed to fetch learning progress");
+    const data = await response.json();
+    return data.progress;
+  } catch (error) {
+    console.error("Error fetching learning progress:", error);
+    throw error;
+  }
+};
+
 export const clearChat = async () => {
   const username = localStorage.getItem("username");
   const token = localStorage.getItem("token");
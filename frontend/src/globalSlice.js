@@ -39,17 +39,26 @@ const globalSlice = createSlice({
       }
     },
     markTopicCompleted: (state, action) => {
-      const { goal, topic, index } = action.payload;
+      const { goal, planIndex, topicIndex } = action.payload;
       const goalIndex = state.learningGoals.findIndex((g) => g.name === goal.name);
       if (goalIndex === -1) return;
 
-      state.learningGoals[goalIndex].study_plans[0].topics[index].completed = true;
-      state.learningGoals[goalIndex].progress = state.learningGoals[goalIndex].progress ? Number(state.learningGoals[goalIndex].progress) + 20 : 20;
+      const topic = state.learningGoals[goalIndex].study_plans[planIndex]?.topics?.[topicIndex];
+      if (!topic) return;
+
+      topic.completed = true;
 
       // if (state.selectedLearningGoal?.name === goal.name) {
       //   state.selectedLearningGoal = { ...state.learningGoals[goalIndex] };
       // }
     },
+    setGoalsProgress: (state, action) => {
+      // Progress aggregates come from the server (/chat/progress or /chat/complete-topic)
+      action.payload.forEach(({ name, percent_complete }) => {
+        const goal = state.learningGoals.find((g) => g.name === name);
+        if (goal) goal.progress = percent_complete;
+      });
+    },
     addMessage: (state, action) => {
       state.chatHistory.push(action.payload);
       if (action.payload.role === "assistant" && action.payload.type === "streaming") {
@@ -87,6 +96,7 @@ export const {
   setIsLearningPathQuery,
   setStreamChat,
   markTopicCompleted,
+  setGoalsProgress,
   setPreferences,
   setIsQuizQuery
 } = globalSlice.actions;
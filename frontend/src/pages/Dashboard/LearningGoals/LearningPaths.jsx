@@ -6,7 +6,12 @@ import {
   setLearningGoals,
   setSelectedLearningGoal,
 } from "../../../globalSlice.js";
-import { askQuestion, getAllLearningGoals } from "../../../api.js";
+import {
+  askQuestion,
+  getAllLearningGoals,
+  getLearningProgress,
+  markTopicCompletedAPI,
+} from "../../../api.js";
 import {
   Card,
   ListGroup,
@@ -42,6 +47,7 @@ import {
   setChatHistory,
   setStreamChat,
   markTopicCompleted,
+  setGoalsProgress,
 } from "../../../globalSlice.js";
 import { FcDeleteColumn } from "react-icons/fc";
 import { FaTrash } from "react-icons/fa";
@@ -68,6 +74,13 @@ const LearningPaths = ({ isCollapsed, togglePreferences, width, setWidth }) => {
         dispatch(setLearningGoals(goals));
       } catch (error) {
         console.error("Failed to fetch learning goals:", error);
+        return;
+      }
+      try {
+        const progress = await getLearningProgress();
+        dispatch(setGoalsProgress(progress));
+      } catch (error) {
+        console.error("Failed to fetch learning progress:", error);
       }
     };
     fetchGoals();
@@ -83,9 +96,20 @@ const LearningPaths = ({ isCollapsed, togglePreferences, width, setWidth }) => {
     }
   }, [selectedLearningGoal, learningGoals, dispatch]);
 
-  const handleMarkCompleted = (goal, topic, index) => {
-    dispatch(markTopicCompleted({ goal, topic, index }));
-    selectedGoalDetails(selectedGoalDetails);
+  const handleMarkCompleted = (goal, planIndex, topicIndex) => {
+    dispatch(markTopicCompleted({ goal, planIndex, topicIndex }));
+    markTopicCompletedAPI(goal.name, planIndex, topicIndex)
+      .then((progress) => {
+        dispatch(setGoalsProgress([progress]));
+        setSelectedGoalDetails((prev) =>
+          prev?.name === progress.name
+            ? { ...prev, progress: progress.percent_complete }
+            : prev
+        );
+      })
+      .catch((error) =>
+        console.error("Failed to save topic completion:", error)
+      );
     setRefresh((prev) => !prev); // Force re-render
   };
 
@@ -388,8 +412,8 @@ const LearningPaths = ({ isCollapsed, togglePreferences, width, setWidth }) => {
                                   onClick={() =>
                                     handleMarkCompleted(
                                       selectedGoalDetails,
-                                      topic,
-                                      planIndex
+                                      planIndex,
+                                      topicIndex
                                     )
                                   }
                                   className="mb-2 border-1 "
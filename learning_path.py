@@ -1,18 +1,18 @@
 # learning_path.py
 import json
 import datetime
+from logger import get_logger
+
+logger = get_logger(__name__)
 
 def process_learning_path_query(user_prompt, username, generate_response, extract_json, store_chat_history, REGENRATE_OR_FILTER_JSON, LEARNING_PATH_PROMPT, retry_count=0, max_retries=3):
     """Processes a learning path query, generating and validating JSON responses."""
-    print("📚 Learning Path Query Detected")
-    print(" Trying to generate Learning Path , Retry Count = " + str(retry_count))
-    if retry_count < max_retries:
-        print(f"🔄 Retrying JSON generation (attempt {retry_count + 1})...")
+    logger.info("Generating learning path", extra={"username": username, "retry_count": retry_count})
 
     if retry_count > 0:
         modified_prompt = f"{user_prompt} {REGENRATE_OR_FILTER_JSON}"
     else:
-        print(LEARNING_PATH_PROMPT)
+        logger.debug("Learning path prompt", extra={"prompt": LEARNING_PATH_PROMPT})
         modified_prompt = f"{user_prompt} {LEARNING_PATH_PROMPT}"
 
     response_content = generate_response(modified_prompt)
@@ -53,7 +53,7 @@ def process_learning_path_query(user_prompt, username, generate_response, extrac
             store_chat_history(username, response_message)
             return response_data
         else:
-            print("❌ Failed to parse learning path JSON")
+            logger.warning("Failed to parse learning path JSON", extra={"username": username, "retry_count": retry_count})
             response_message = {
                 "role": "assistant",
                 "content": extract_json(response_content),
@@ -0,0 +1,194 @@
+# logger.py
+import os
+import re
+import json
+import queue
+import atexit
+import random
+import time
+import uuid
+import logging
+import datetime
+import contextvars
+from logging.handlers import QueueHandler, QueueListener
+
+# Request ID of the request currently being served (set by RequestIdMiddleware)
+request_id_var = contextvars.ContextVar("request_id", default="-")
+
+# Client-supplied request IDs are only trusted if they look like an ID
+REQUEST_ID_PATTERN = re.compile(r"[A-Za-z0-9-]{1,64}")
+
+# Logging configuration (overridable through environment variables)
+LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").upper()
+LOG_QUEUE_SIZE = int(os.getenv("LOG_QUEUE_SIZE", "10000"))
+LOG_MAX_FIELD_CHARS = int(os.getenv("LOG_MAX_FIELD_CHARS", "512"))
+LOG_MAX_TRACEBACK_CHARS = int(os.getenv("LOG_MAX_TRACEBACK_CHARS", "4096"))
+
+# Fraction of records kept per level; WARNING and above are never sampled by default
+LOG_SAMPLE_RATES = {
+    logging.DEBUG: float(os.getenv("LOG_SAMPLE_DEBUG", "0.1")),
+    logging.INFO: float(os.getenv("LOG_SAMPLE_INFO", "1.0")),
+    logging.WARNING: float(os.getenv("LOG_SAMPLE_WARNING", "1.0")),
+    logging.ERROR: 1.0,
+    logging.CRITICAL: 1.0,
+}
+
+# Attributes every LogRecord has; anything else was passed through `extra=`
+_RESERVED_ATTRS = set(logging.LogRecord("", 0, "", 0, "", (), None).__dict__) | {"message", "asctime", "request_id"}
+
+_listener = None
+
+
+def truncate(value, limit=LOG_MAX_FIELD_CHARS):
+    """Truncates long values so a single log line stays bounded.
+
+    Scalars pass through unchanged; any other non-string value is serialized
+    to JSON first so nested dicts and lists are bounded too.
+    """
+    if value is None or isinstance(value, (bool, int, float)):
+        return value
+    if not isinstance(value, str):
+        value = json.dumps(value, default=str, ensure_ascii=False)
+    if len(value) > limit:
+        return f"{value[:limit]}...(+{len(value) - limit} chars)"
+    return value
+
+
+class RequestIdFilter(logging.Filter):
+    """Stamps each record with the request ID of the calling context."""
+
+    def filter(self, record):
+        record.request_id = request_id_var.get()
+        return True
+
+
+class SamplingFilter(logging.Filter):
+    """Drops a share of records per level so high-volume events stay cheap."""
+
+    def filter(self, record):
+        rate = LOG_SAMPLE_RATES.get(record.levelno, 1.0)
+        return rate >= 1.0 or random.random() < rate
+
+
+class JSONFormatter(logging.Formatter):
+    """Formats records as single-line JSON with truncated payloads."""
+
+    def format(self, record):
+        entry = {
+            "ts": datetime.datetime.utcfromtimestamp(record.created).isoformat() + "Z",
+            "level": record.levelname,
+            "logger": record.name,
+            "request_id": getattr(record, "request_id", "-"),
+            "msg": truncate(record.getMessage()),
+        }
+        for key, value in record.__dict__.items():
+            if key not in _RESERVED_ATTRS:
+                entry[key] = truncate(value)
+        if record.exc_info:
+            entry["exc_info"] = truncate(self.formatException(record.exc_info), LOG_MAX_TRACEBACK_CHARS)
+        return json.dumps(entry, default=str, ensure_ascii=False)
+
+
+class NonBlockingQueueHandler(QueueHandler):
+    """Hands records to the listener thread without ever blocking the caller."""
+
+    def __init__(self, log_queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def prepare(self, record):
+        # Formatting happens on the listener thread, not on the event loop
+        return record
+
+    def enqueue(self, record):
+        try:
+            if self.dropped:
+                self.queue.put_nowait(self._dropped_record())
+                self.dropped = 0
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+    def _dropped_record(self):
+        """Builds a warning reporting how many records were lost to a full queue."""
+        record = logging.LogRecord(__name__, logging.WARNING, __file__, 0, "Log queue full, dropped %d records", (self.dropped,), None)
+        record.request_id = "-"
+        record.dropped_records = self.dropped
+        return record
+
+
+class RequestIdMiddleware:
+    """ASGI middleware that tags each request with an ID and logs it once it completes."""
+
+    def __init__(self, app):
+        self.app = app
+        self.logger = get_logger("access")
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request_id = dict(scope["headers"]).get(b"x-request-id", b"").decode("latin-1")
+        if not REQUEST_ID_PATTERN.fullmatch(request_id):
+            request_id = uuid.uuid4().hex
+
+        token = request_id_var.set(request_id)
+        start_time = time.perf_counter()
+        status_code = 500
+
+        def log_request():
+            self.logger.info("Request handled", extra={
+                "method": scope["method"],
+                "path": scope["path"],
+                "status_code": status_code,
+                "duration_ms": round((time.perf_counter() - start_time) * 1000, 2)
+            })
+
+        async def send_with_request_id(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                message["headers"] = list(message.get("headers", [])) + [(b"x-request-id", request_id.encode("latin-1"))]
+            await send(message)
+            # Logged after the last body chunk so streamed responses report their full duration
+            if message["type"] == "http.response.body" and not message.get("more_body", False):
+                log_request()
+
+        try:
+            await self.app(scope, receive, send_with_request_id)
+        except Exception:
+            log_request()
+            raise
+        finally:
+            request_id_var.reset(token)
+
+
+def setup_logging():
+    """Configures the root logger with a queue-backed JSON pipeline (idempotent)."""
+    global _listener
+    if _listener is not None:
+        return
+
+    log_queue = queue.Queue(maxsize=LOG_QUEUE_SIZE)
+
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(JSONFormatter())
+
+    queue_handler = NonBlockingQueueHandler(log_queue)
+    queue_handler.addFilter(SamplingFilter())
+    queue_handler.addFilter(RequestIdFilter())
+
+    root = logging.getLogger()
+    root.handlers = [queue_handler]
+    root.setLevel(LOG_LEVEL)
+
+    _listener = QueueListener(log_queue, stream_handler, respect_handler_level=True)
+    _listener.start()
+    atexit.register(_listener.stop)
+
+
+def get_logger(name):
+    """Returns a logger wired into the shared logging pipeline."""
+    setup_logging()
+    return logging.getLogger(name)
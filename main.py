@@ -3,6 +3,7 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 from auth import auth_router
 from chat import chat_router
+from logger import RequestIdMiddleware
 import os
 
 # Initialize FastAPI app
@@ -29,6 +30,9 @@ app.add_middleware(
     allow_headers=["*"],  # Allow all headers
 )
 
+# Tag every request with an ID so its log lines can be correlated
+app.add_middleware(RequestIdMiddleware)
+
 # ✅ 1. Include Routers **before** mounting frontend
 app.include_router(auth_router, prefix="/auth", tags=["Authentication"])
 app.include_router(chat_router, prefix="/chat", tags=["Chat"])
@@ -0,0 +1,126 @@
+# progress.py
+import re
+
+# Hours per unit for time_required strings; days, weeks and months use the daily study time
+HOURS_PER_UNIT = {
+    "minute": 1 / 60,
+    "min": 1 / 60,
+    "hour": 1,
+    "hr": 1,
+    "h": 1,
+}
+DAYS_PER_UNIT = {
+    "day": 1,
+    "week": 7,
+    "month": 30,
+}
+
+# A number (or range such as "2-3") followed by a known time unit
+TIME_REQUIRED_PATTERN = re.compile(
+    r"(\d+(?:\.\d+)?)(?:\s*(?:-|–|to)\s*(\d+(?:\.\d+)?))?\s*(minutes?|mins?|hours?|hrs?|h|days?|weeks?|months?)\b",
+    re.IGNORECASE
+)
+BARE_NUMBER_PATTERN = re.compile(r"\s*(\d+(?:\.\d+)?)\s*")
+
+DEFAULT_DAILY_HOURS = 5
+
+
+def get_daily_hours(preferences):
+    """Reads the daily study time (in hours) from the user's preferences."""
+    try:
+        daily_hours = float((preferences or {}).get("timeValue", DEFAULT_DAILY_HOURS))
+    except (TypeError, ValueError):
+        return DEFAULT_DAILY_HOURS
+    return daily_hours if daily_hours > 0 else DEFAULT_DAILY_HOURS
+
+
+def parse_hours(time_required, daily_hours=DEFAULT_DAILY_HOURS):
+    """Converts a time_required value like '3 hours' or '2 weeks' into hours (0 if unrecognised)."""
+    if isinstance(time_required, (int, float)):
+        return float(time_required)
+    if not isinstance(time_required, str):
+        return 0.0
+
+    # The frontend shows a bare number as hours
+    bare = BARE_NUMBER_PATTERN.fullmatch(time_required)
+    if bare:
+        return float(bare.group(1))
+
+    match = TIME_REQUIRED_PATTERN.search(time_required)
+    if not match:
+        return 0.0
+
+    # Ranges like "2-3 hours" count as their upper bound
+    value = float(match.group(2) or match.group(1))
+    unit = match.group(3).lower()
+    unit = unit if unit == "h" else unit.rstrip("s")
+    if unit in DAYS_PER_UNIT:
+        return value * DAYS_PER_UNIT[unit] * daily_hours
+    return value * HOURS_PER_UNIT[unit]
+
+
+def build_progress_stats(study_plans, daily_hours=DEFAULT_DAILY_HOURS):
+    """Computes the completion counters for a learning goal from its study plans."""
+    stats = {
+        "total_topics": 0,
+        "completed_topics": 0,
+        "total_subtopics": 0,
+        "completed_subtopics": 0,
+        "total_hours": 0.0,
+        "remaining_hours": 0.0,
+        "daily_hours": daily_hours,
+    }
+    for plan in study_plans:
+        merge_progress_stats(stats, plan_progress_stats(plan, daily_hours))
+    return stats
+
+
+def plan_progress_stats(plan, daily_hours=DEFAULT_DAILY_HOURS):
+    """Computes the completion counters for a single study plan."""
+    stats = {
+        "total_topics": 0,
+        "completed_topics": 0,
+        "total_subtopics": 0,
+        "completed_subtopics": 0,
+        "total_hours": 0.0,
+        "remaining_hours": 0.0,
+    }
+    topics = plan.get("topics", []) if isinstance(plan, dict) else []
+    for topic in (t for t in topics if isinstance(t, dict)):
+        hours = parse_hours(topic.get("time_required"), daily_hours)
+        subtopics = topic.get("subtopics", [])
+
+        stats["total_topics"] += 1
+        stats["total_hours"] += hours
+        stats["total_subtopics"] += len(subtopics)
+        stats["completed_subtopics"] += sum(1 for sub in subtopics if isinstance(sub, dict) and sub.get("completed"))
+        if topic.get("completed"):
+            stats["completed_topics"] += 1
+        else:
+            stats["remaining_hours"] += hours
+    return stats
+
+
+def merge_progress_stats(stats, other):
+    """Adds the counters of `other` into `stats` in place."""
+    for key in ("total_topics", "completed_topics", "total_subtopics", "completed_subtopics", "total_hours", "remaining_hours"):
+        stats[key] = stats.get(key, 0) + other.get(key, 0)
+    return stats
+
+
+def summarize_progress(name, stats):
+    """Turns stored counters into the aggregates returned by the progress API."""
+    total_topics = stats.get("total_topics", 0)
+    completed_topics = stats.get("completed_topics", 0)
+    percent_complete = round(completed_topics / total_topics * 100, 2) if total_topics else 0.0
+
+    return {
+        "name": name,
+        "percent_complete": percent_complete,
+        "topics_completed": completed_topics,
+        "total_topics": total_topics,
+        "subtopics_completed": stats.get("completed_subtopics", 0),
+        "total_subtopics": stats.get("total_subtopics", 0),
+        "total_hours": round(stats.get("total_hours", 0.0), 2),
+        "estimated_hours_remaining": round(max(stats.get("remaining_hours", 0.0), 0.0), 2),
+    }
@@ -1,6 +1,9 @@
 # utils.py
 import json
 import re
+from logger import get_logger
+
+logger = get_logger(__name__)
 
 def extract_json(text):
     """Extracts JSON from a string."""
@@ -11,5 +14,5 @@ def extract_json(text):
         try:
             return json.loads(json_str)
         except json.JSONDecodeError:
-            print("Error decoding JSON")
+            logger.warning("Error decoding JSON")
     return None
\ No newline at end of file